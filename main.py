@@ -1,16 +1,51 @@
 import asyncio
 import datetime
+import functools
+import hashlib
+import json
 import os
+import random
 import tempfile
-import traceback
+import time
 from typing import Any, Tuple, List
 
 import aiohttp
+import yarl
 from astrbot.api import AstrBotConfig, logger
 from astrbot.api.event import AstrMessageEvent, filter
 from astrbot.api.star import Context, Star, register
 from astrbot.core.message.message_event_result import MessageChain
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # orjson 为可选依赖，未安装时回退到标准库
+    _json_loads = json.loads
+
+# 抓取结果缓存：文本 1 小时、图片 6 小时，缓存键带日期所以不跨天；最多保留 16 条
+TEXT_CACHE_TTL = 3600
+IMAGE_CACHE_TTL = 6 * 3600
+CACHE_MAX_ENTRIES = 16
+
+_IMG_EXTS = (".jpg", ".jpeg", ".png")
+# 下载图片时每次写入的块大小
+IMAGE_CHUNK_SIZE = 64 * 1024
+# 图片按来源与日期缓存在临时目录，保留 2 天
+IMAGE_FILE_PREFIX = "nysched_"
+IMAGE_RETENTION_SECONDS = 2 * 86400
+
+# 错过推送时间点后仍补发的宽限时间
+PUSH_GRACE_SECONDS = 300
+
+# 群发并发数与默认每秒最多发送的消息数（0.5 即每 2 秒一条）
+SEND_CONCURRENCY = 5
+SEND_RATE_PER_SECOND = 0.5
+
+
+class FetchError(Exception):
+    """接口返回了非预期的状态码或内容"""
+
 
 @register(
     "astrbot_nyscheduler",
@@ -29,6 +64,12 @@ class Daily60sNewsPlugin(Star):
         self.groups = self.config.groups
         # 支持多个时间点，如 "10:00,18:00"
         self.push_times = [t.strip() for t in getattr(self.config, "push_time", "08:00").split(",")]
+        self._parsed_push_times: list[datetime.time] = []
+        for t_str in self.push_times:
+            try:
+                self._parsed_push_times.append(self._parse_time(t_str))
+            except Exception as e:
+                logger.warning(f"无效推送时间 '{t_str}': {e}")
         self.news_api = getattr(self.config, "news_api", "https://api.nycnm.cn/API/60s.php")
         self.format = getattr(self.config, "format", "image")
         self.moyu_format = getattr(self.config, "moyu_format", "image")
@@ -43,8 +84,87 @@ class Daily60sNewsPlugin(Star):
         self.ai_api = getattr(self.config, "ai_api", "https://api.nycnm.cn/API/aizixun.php")
         self.api_key = getattr(self.config, "api_key", "")
         self.timeout = getattr(self.config, "timeout", 30)
+        self.send_rate = float(getattr(self.config, "send_rate", SEND_RATE_PER_SECOND))
+        # 复用同一个会话，保持连接池与 keep-alive
+        self._session: aiohttp.ClientSession | None = None
+        # 限制同时向群组发送的消息数，代替逐个 sleep 的串行发送
+        self._send_semaphore = asyncio.Semaphore(SEND_CONCURRENCY)
+        # 令牌桶：按时间戳在发送时计算可用令牌，限制发送速率而不是每条消息固定等待
+        self._send_tokens = max(1.0, self.send_rate)
+        self._send_tokens_at = 0.0
+        self._send_lock = asyncio.Lock()
+        # 按 "接口|类型|日期" 缓存当天已抓取的文本或图片路径，连同其 Last-Modified 用于条件请求
+        self._cache: dict[str, tuple[float, Any, str | None]] = {}
+        # 最近一次已触发的推送时间点，之前的时间点顺延到次日
+        self._last_push = datetime.datetime.now()
+        # 各内容的抓取函数，按配置绑定一次
+        self._fetch_news_text = functools.partial(
+            self._fetch, self.news_api, self.format,
+            want_image=False, date_param=True, text_parser=self._news_text_from_json,
+        )
+        self._fetch_news_image_path = functools.partial(
+            self._fetch, self.news_api, self.format,
+            want_image=True, date_param=True, image_url_parser=self._news_image_from_json,
+        )
+        self._moyu_fetch_text = functools.partial(self._fetch, self.moyu_api, self.moyu_format, want_image=False)
+        self._moyu_fetch_image_path = functools.partial(self._fetch, self.moyu_api, self.moyu_format, want_image=True)
+        self._gold_fetch_text = functools.partial(self._fetch, self.gold_api, self.gold_format, want_image=False)
+        self._gold_fetch_image_path = functools.partial(self._fetch, self.gold_api, self.gold_format, want_image=True)
+        self._ai_fetch_text = functools.partial(self._fetch, self.ai_api, self.ai_format, want_image=False)
+        self._ai_fetch_image_path = functools.partial(self._fetch, self.ai_api, self.ai_format, want_image=True)
         logger.info(f"插件配置: {self.config}")
         self._monitoring_task = asyncio.create_task(self._daily_task())
+        self._cleanup_task = asyncio.create_task(self._cleanup_images_task())
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """懒加载共享的 ClientSession"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=10,
+                ttl_dns_cache=300,
+                enable_cleanup_closed=True,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout, connect=10),
+            )
+        return self._session
+
+    def _cache_key(self, api_url: str, kind: str) -> str:
+        return f"{api_url}|{kind}|{datetime.date.today().isoformat()}"
+
+    def _conditional_headers(self, key: str, kind: str) -> dict:
+        """缓存条目带有 Last-Modified 时，用它发送 If-Modified-Since"""
+        entry = self._cache_entry(key, kind)
+        if entry and entry[2]:
+            return {"If-Modified-Since": entry[2]}
+        return {}
+
+    def _cache_entry(self, key: str, kind: str) -> tuple[float, Any, str | None] | None:
+        """取缓存条目（忽略 TTL），图片文件已被清理时视为没有缓存"""
+        hit = self._cache.get(key)
+        if not hit:
+            return None
+        if kind == "image" and not os.path.exists(hit[1]):
+            return None
+        return hit
+
+    async def _cached(self, api_url: str, kind: str, coro_factory) -> Tuple[str, bool]:
+        """命中当天缓存则直接返回，否则调用 coro_factory 抓取，成功结果连同其 Last-Modified 一起缓存"""
+        key = self._cache_key(api_url, kind)
+        ttl = IMAGE_CACHE_TTL if kind == "image" else TEXT_CACHE_TTL
+        hit = self._cache.get(key)
+        if hit and time.time() - hit[0] < ttl:
+            if kind != "image" or os.path.exists(hit[1]):
+                return hit[1], True
+        result, ok, last_modified = await coro_factory()
+        if ok:
+            self._cache.pop(key, None)
+            self._cache[key] = (time.time(), result, last_modified)
+            while len(self._cache) > CACHE_MAX_ENTRIES:
+                self._cache.pop(next(iter(self._cache)))
+        return result, ok
 
     def _parse_time(self, time_str: str) -> datetime.time:
         """解析 'HH:MM' 格式为 time 对象"""
@@ -52,26 +172,25 @@ class Daily60sNewsPlugin(Star):
         return datetime.time(hour=h, minute=m)
 
     def _get_next_push_time(self) -> datetime.datetime:
-        """返回距离现在最近的下一个推送时间点（datetime）"""
+        """返回上次推送之后最近的下一个推送时间点（datetime），刚错过不久的时间点会立即到期"""
+        if not self._parsed_push_times:
+            raise ValueError("没有有效的推送时间配置")
         now = datetime.datetime.now()
+        # 推送进行中错过的时间点仍补发，更早错过的（挂起、对时等）顺延到次日
+        cutoff = max(self._last_push, now - datetime.timedelta(seconds=PUSH_GRACE_SECONDS))
         candidates = []
-        for t_str in self.push_times:
-            try:
-                t = self._parse_time(t_str)
-                candidate = now.replace(hour=t.hour, minute=t.minute, second=0, microsecond=0)
-                if candidate <= now:
-                    candidate += datetime.timedelta(days=1)
-                candidates.append(candidate)
-            except Exception as e:
-                logger.warning(f"无效推送时间 '{t_str}': {e}")
-        if not candidates:
-            raise ValueError("没有有效的推送时间配置")
+        for t in self._parsed_push_times:
+            candidate = datetime.datetime.combine(now.date(), t)
+            if candidate <= cutoff:
+                candidate += datetime.timedelta(days=1)
+            candidates.append(candidate)
         return min(candidates)
 
     async def terminate(self):
         """插件卸载时调用"""
         tasks = [
             "_monitoring_task",
+            "_cleanup_task",
             "_moyu_task",
             "_gold_task",
             "_ai_task"
@@ -81,29 +200,50 @@ class Daily60sNewsPlugin(Star):
                 task = getattr(self, attr)
                 if task and not task.done():
                     task.cancel()
+        if self._session and not self._session.closed:
+            await self._session.close()
         logger.info("每日60s新闻插件: 定时任务已停止")
 
     # ========== 公共方法：发送到群组 ==========
+    async def _acquire_send_token(self):
+        """取一个发送令牌，令牌不足时按速率等待；send_rate <= 0 表示不限速"""
+        if self.send_rate <= 0:
+            return
+        loop = asyncio.get_running_loop()
+        async with self._send_lock:
+            capacity = max(1.0, self.send_rate)
+            now = loop.time()
+            tokens = min(capacity, self._send_tokens + (now - self._send_tokens_at) * self.send_rate)
+            if tokens < 1:
+                await asyncio.sleep((1 - tokens) / self.send_rate)
+                now = loop.time()
+                tokens = 1.0
+            self._send_tokens = tokens - 1
+            self._send_tokens_at = now
+
+    async def _send_one(self, target: str, chain: MessageChain):
+        """在并发与速率上限内向单个群组发送消息"""
+        await self._acquire_send_token()
+        async with self._send_semaphore:
+            try:
+                await self.context.send_message(target, chain)
+            except Exception as e:
+                logger.error(f"[推送] 发送到 {target} 失败: {e}")
+
     async def _send_to_groups(self, fetch_func, is_image: bool):
         try:
             if is_image:
                 path, ok = await fetch_func()
                 if not ok:
                     raise Exception(str(path))
-                for target in self.groups:
-                    await self.context.send_message(target, MessageChain().file_image(path))
-                    await asyncio.sleep(2)
-                try:
-                    os.remove(path)
-                except Exception:
-                    pass
+                chain = MessageChain().file_image(path)
+                await asyncio.gather(*(self._send_one(target, chain) for target in self.groups))
             else:
                 content, ok = await fetch_func()
                 if not ok:
                     raise Exception(str(content))
-                for target in self.groups:
-                    await self.context.send_message(target, MessageChain().message(content))
-                    await asyncio.sleep(2)
+                chain = MessageChain().message(content)
+                await asyncio.gather(*(self._send_one(target, chain) for target in self.groups))
         except Exception as e:
             logger.error(f"[推送] 失败: {e}")
 
@@ -116,7 +256,7 @@ class Daily60sNewsPlugin(Star):
     async def check_status(self, event: AstrMessageEvent):
         next_push = self._get_next_push_time()
         delta = next_push - datetime.datetime.now()
-        hours, remainder = divmod(int(delta.total_seconds()), 3600)
+        hours, remainder = divmod(max(int(delta.total_seconds()), 0), 3600)
         minutes = remainder // 60
         yield event.plain_result(
             f"每日60s新闻插件运行中\n"
@@ -135,257 +275,249 @@ class Daily60sNewsPlugin(Star):
     async def get_today_news(self, event: AstrMessageEvent):
         await self._handle_fetch(event, self._fetch_news_image_path, self._fetch_news_text, self.format)
 
-    @filter.command("新闻")
+    @filter.command("新闻", alias={"60s", "60秒", "早报"})
     async def cmd_news(self, event: AstrMessageEvent):
-        await self.get_today_news(event)
-
-    @filter.command("60s")
-    async def cmd_60s(self, event: AstrMessageEvent):
-        await self.get_today_news(event)
-
-    @filter.command("60秒")
-    async def cmd_60sec(self, event: AstrMessageEvent):
-        await self.get_today_news(event)
-
-    @filter.command("早报")
-    async def cmd_morning_news(self, event: AstrMessageEvent):
-        await self.get_today_news(event)
-
-    async def _fetch_news_text(self) -> Tuple[str, bool]:
-        retries = 3
-        timeout = self.timeout
-        fmt = "json" if self.format == "image" else "text"
-        date = datetime.datetime.now().strftime("%Y-%m-%d")
-        for attempt in range(retries):
-            try:
-                url = f"{self.news_api}?date={date}&format={fmt}"
-                if self.api_key:
-                    url += f"&apikey={self.api_key}"
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(url, timeout=timeout) as response:
-                        if response.status != 200:
-                            raise Exception(f"API返回错误代码: {response.status}")
-                        if fmt == "json":
-                            data = await response.json()
-                            payload = data.get("data", {})
-                            date_str = payload.get("date") or date
-                            tip = payload.get("tip") or ""
-                            news_list = payload.get("news") or []
-                            lines = [f"{date_str} 每日60秒新闻", *(f"• {item}" for item in news_list)]
-                            if tip:
-                                lines.append(f"提示：{tip}")
-                            return "\n".join(lines), True
-                        else:
-                            content = await response.read()
-                            return content.decode("utf-8", errors="ignore"), True
-            except Exception as e:
-                logger.error(f"[mnews] 请求失败 {attempt + 1}/{retries}: {e}")
-                if attempt == retries - 1:
-                    return f"接口报错，请联系管理员:{e}", False
-                await asyncio.sleep(1)
-        return "未知错误", False
-
-    async def _fetch_news_image_path(self) -> Tuple[str, bool]:
-        retries = 3
-        timeout = self.timeout
-        fmt = "json" if self.format == "text" else "image"
-        date = datetime.datetime.now().strftime("%Y-%m-%d")
-        for attempt in range(retries):
-            try:
-                url = f"{self.news_api}?date={date}&format={fmt}"
-                if self.api_key:
-                    url += f"&apikey={self.api_key}"
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(url, timeout=timeout) as response:
-                        if response.status != 200:
-                            raise Exception(f"API返回错误代码: {response.status}")
-                        if fmt == "json":
-                            data = await response.json()
-                            payload = data.get("data", {})
-                            img_url = payload.get("image") or payload.get("cover")
-                            if not img_url:
-                                raise Exception("JSON中未找到图片URL")
-                            async with session.get(img_url, timeout=timeout) as img_resp:
-                                if img_resp.status != 200:
-                                    raise Exception(f"图片下载失败，状态码: {img_resp.status}")
-                                img_bytes = await img_resp.read()
-                                f = tempfile.NamedTemporaryFile(delete=False, suffix=".jpeg")
-                                f.write(img_bytes)
-                                f.flush()
-                                f.close()
-                                return f.name, True
-                        else:
-                            img_bytes = await response.read()
-                            f = tempfile.NamedTemporaryFile(delete=False, suffix=".jpeg")
-                            f.write(img_bytes)
-                            f.flush()
-                            f.close()
-                            return f.name, True
-            except Exception as e:
-                logger.error(f"[mnews] 请求失败 {attempt + 1}/{retries}: {e}")
-                if attempt == retries - 1:
-                    return f"接口报错，请联系管理员:{e}", False
-                await asyncio.sleep(1)
-        return "未知错误", False
+        await self._handle_fetch(event, self._fetch_news_image_path, self._fetch_news_text, self.format)
 
     # ========== 摸鱼日历 ==========
     @filter.command_group("摸鱼管理")
     def moyu(self): pass
 
-    @filter.command("摸鱼")
+    @filter.command("摸鱼", alias={"摸鱼日历"})
     async def cmd_moyu_simple(self, event: AstrMessageEvent):
         await self._handle_fetch(event, self._moyu_fetch_image_path, self._moyu_fetch_text, self.moyu_format)
 
-    @filter.command("摸鱼日历")
-    async def cmd_moyu_calendar(self, event: AstrMessageEvent):
-        await self.cmd_moyu_simple(event)
-
     @moyu.command("今日")
     async def moyu_today(self, event: AstrMessageEvent):
-        await self.cmd_moyu_simple(event)
-
-    async def _moyu_fetch_text(self) -> Tuple[str, bool]:
-        return await self._generic_fetch_text(self.moyu_api, self.moyu_format)
-
-    async def _moyu_fetch_image_path(self) -> Tuple[str, bool]:
-        return await self._generic_fetch_image_path(self.moyu_api, self.moyu_format)
+        await self._handle_fetch(event, self._moyu_fetch_image_path, self._moyu_fetch_text, self.moyu_format)
 
     # ========== 金价 ==========
     @filter.command_group("金价管理")
     def gold(self): pass
 
-    @filter.command("金价")
+    @filter.command("金价", alias={"黄金"})
     async def cmd_gold_simple(self, event: AstrMessageEvent):
         await self._handle_fetch(event, self._gold_fetch_image_path, self._gold_fetch_text, self.gold_format)
 
-    @filter.command("黄金")
-    async def cmd_gold_alt(self, event: AstrMessageEvent):
-        await self.cmd_gold_simple(event)
-
     @gold.command("今日")
     async def gold_today(self, event: AstrMessageEvent):
-        await self.cmd_gold_simple(event)
-
-    async def _gold_fetch_text(self) -> Tuple[str, bool]:
-        return await self._generic_fetch_text(self.gold_api, self.gold_format)
-
-    async def _gold_fetch_image_path(self) -> Tuple[str, bool]:
-        return await self._generic_fetch_image_path(self.gold_api, self.gold_format)
+        await self._handle_fetch(event, self._gold_fetch_image_path, self._gold_fetch_text, self.gold_format)
 
     # ========== AI资讯 ==========
     @filter.command_group("AI资讯管理")
     def ai(self): pass
 
-    @filter.command("AI资讯")
+    @filter.command("AI资讯", alias={"AI新闻"})
     async def cmd_ai_simple(self, event: AstrMessageEvent):
         await self._handle_fetch(event, self._ai_fetch_image_path, self._ai_fetch_text, self.ai_format)
 
-    @filter.command("AI新闻")
-    async def cmd_ai_news(self, event: AstrMessageEvent):
-        await self.cmd_ai_simple(event)
-
     @ai.command("今日")
     async def ai_today(self, event: AstrMessageEvent):
-        await self.cmd_ai_simple(event)
-
-    async def _ai_fetch_text(self) -> Tuple[str, bool]:
-        return await self._generic_fetch_text(self.ai_api, self.ai_format)
-
-    async def _ai_fetch_image_path(self) -> Tuple[str, bool]:
-        return await self._generic_fetch_image_path(self.ai_api, self.ai_format)
+        await self._handle_fetch(event, self._ai_fetch_image_path, self._ai_fetch_text, self.ai_format)
 
     # ========== 通用抓取方法 ==========
-    async def _generic_fetch_text(self, api_url: str, fmt: str) -> Tuple[str, bool]:
+    async def _fetch(
+        self,
+        api_url: str,
+        fmt: str,
+        *,
+        want_image: bool,
+        date_param: bool = False,
+        text_parser=None,
+        image_url_parser=None,
+    ) -> Tuple[str, bool]:
+        """带当天缓存的统一抓取入口，返回 (文本或图片路径, 是否成功)"""
+        return await self._cached(
+            api_url,
+            "image" if want_image else "text",
+            lambda: self._download(
+                api_url,
+                fmt,
+                want_image=want_image,
+                date_param=date_param,
+                text_parser=text_parser or self._extract_first_string,
+                image_url_parser=image_url_parser or self._extract_first_image_url,
+            ),
+        )
+
+    async def _download(
+        self,
+        api_url: str,
+        fmt: str,
+        *,
+        want_image: bool,
+        date_param: bool,
+        text_parser,
+        image_url_parser,
+    ) -> Tuple[str, bool, str | None]:
+        """返回 (文本或图片路径, 是否成功, Last-Modified)，Last-Modified 随结果一起写入缓存"""
         retries = 3
-        timeout = self.timeout
-        use_json = fmt == "image"
+        kind = "image" if want_image else "text"
+        cache_key = self._cache_key(api_url, kind)
+        # 所有重试共享 self.timeout 的总时长
+        deadline = time.monotonic() + self.timeout
+        # 配置格式与所需内容不一致时改取 json，再从中提取文本或图片链接
+        if want_image:
+            req_fmt = "json" if fmt == "text" else "image"
+        else:
+            req_fmt = "json" if fmt == "image" else "text"
+        query = {"format": req_fmt}
+        if date_param:
+            query["date"] = datetime.date.today().isoformat()
+        if self.api_key:
+            query["apikey"] = self.api_key
+        url = yarl.URL(api_url).update_query(query)
         for attempt in range(retries):
+            timeout = aiohttp.ClientTimeout(total=max(deadline - time.monotonic(), 0.1), connect=10)
             try:
-                url = f"{api_url}?format={'json' if use_json else 'text'}"
-                if self.api_key:
-                    url += f"&apikey={self.api_key}"
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(url, timeout=timeout) as resp:
-                        if resp.status != 200:
-                            raise Exception(f"状态码: {resp.status}")
-                        if use_json:
-                            data = await resp.json(content_type=None)
-                            txt = self._extract_first_string(data)
-                            return txt or str(data), True
-                        else:
-                            content = await resp.read()
-                            return content.decode("utf-8", errors="ignore"), True
-            except Exception as e:
-                logger.error(f"[通用文本] 请求失败 {attempt + 1}/{retries}: {e}")
-                if attempt == retries - 1:
-                    return f"接口报错: {e}", False
-                await asyncio.sleep(1)
-        return "未知错误", False
+                session = await self._get_session()
+                headers = self._conditional_headers(cache_key, kind)
+                async with session.get(url, timeout=timeout, headers=headers) as resp:
+                    if resp.status == 304:
+                        entry = self._cache_entry(cache_key, kind)
+                        if entry is not None:
+                            return entry[1], True, entry[2]
+                    if resp.status != 200:
+                        raise FetchError(f"状态码: {resp.status}")
+                    # 仅在结果成功产出后随之返回，避免解析失败后用新的 Last-Modified 换回旧缓存
+                    last_modified = resp.headers.get("Last-Modified")
+                    if req_fmt != "json":
+                        if want_image:
+                            return await self._save_image(resp, self._image_path(str(url))), True, last_modified
+                        content = await resp.read()
+                        return content.decode("utf-8", errors="ignore"), True, last_modified
+                    data = _json_loads(await resp.read())
+                    if not want_image:
+                        txt = text_parser(data)
+                        return txt or str(data), True, last_modified
+                    img_url = image_url_parser(data)
+                    if not img_url:
+                        raise FetchError("JSON未找到图片URL")
+                    path = self._image_path(img_url)
+                    if os.path.exists(path):
+                        return path, True, last_modified
+                    async with session.get(img_url, timeout=timeout) as ir:
+                        if ir.status != 200:
+                            raise FetchError(f"图片状态码: {ir.status}")
+                        return await self._save_image(ir, path), True, last_modified
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError, FetchError) as e:
+                # 超时已用尽共享的时间预算，不再延长；TimeoutError 本身没有消息，单独说明
+                reason = "请求超时" if isinstance(e, asyncio.TimeoutError) else e
+                logger.error(f"[抓取] {api_url} 请求失败 {attempt + 1}/{retries}: {reason}")
+                delay = self._retry_delay(attempt, e)
+                if attempt == retries - 1 or time.monotonic() + delay >= deadline:
+                    return f"接口报错，请联系管理员: {reason}", False, None
+                await asyncio.sleep(delay)
+        return "未知错误", False, None
+
+    @staticmethod
+    def _retry_delay(attempt: int, error: Exception) -> float:
+        """连接立即失败时首次重试不等待，其余按指数退避并加少量抖动"""
+        if attempt == 0 and isinstance(error, aiohttp.ClientConnectorError):
+            return 0
+        return min(8, 0.25 * (2 ** attempt)) + random.random() * 0.1
+
+    @staticmethod
+    def _news_payload(data) -> dict:
+        """取出 60s 新闻 json 中的 data 字段，结构不符时抛出 FetchError"""
+        payload = data.get("data", {}) if isinstance(data, dict) else None
+        if not isinstance(payload, dict):
+            raise FetchError("新闻JSON结构异常")
+        return payload
+
+    @staticmethod
+    def _news_text_from_json(data) -> str:
+        """将 60s 新闻的 json 数据整理为文本"""
+        payload = Daily60sNewsPlugin._news_payload(data)
+        date_str = payload.get("date") or datetime.date.today().isoformat()
+        tip = payload.get("tip") or ""
+        news_list = payload.get("news") or []
+        lines = [f"{date_str} 每日60秒新闻", *(f"• {item}" for item in news_list)]
+        if tip:
+            lines.append(f"提示：{tip}")
+        return "\n".join(lines)
+
+    @staticmethod
+    def _news_image_from_json(data) -> str | None:
+        payload = Daily60sNewsPlugin._news_payload(data)
+        return payload.get("image") or payload.get("cover")
+
+    @staticmethod
+    def _image_path(source: str) -> str:
+        """按图片来源和日期生成固定的本地缓存路径"""
+        digest = hashlib.sha1(f"{source}|{datetime.date.today().isoformat()}".encode()).hexdigest()
+        return os.path.join(tempfile.gettempdir(), f"{IMAGE_FILE_PREFIX}{digest}.jpg")
+
+    @staticmethod
+    async def _save_image(resp: aiohttp.ClientResponse, path: str) -> str:
+        """将图片响应分块写入 path，写完后再替换到位，返回文件路径"""
+        f = tempfile.NamedTemporaryFile(
+            delete=False, dir=os.path.dirname(path), prefix=IMAGE_FILE_PREFIX, suffix=".part"
+        )
+        try:
+            async for chunk in resp.content.iter_chunked(IMAGE_CHUNK_SIZE):
+                f.write(chunk)
+        except BaseException:
+            f.close()
+            os.remove(f.name)
+            raise
+        f.close()
+        os.replace(f.name, path)
+        return path
+
+    @staticmethod
+    def _prune_images():
+        """删除超过保留期限的图片缓存文件"""
+        expire_before = time.time() - IMAGE_RETENTION_SECONDS
+        with os.scandir(tempfile.gettempdir()) as it:
+            for entry in it:
+                if not entry.name.startswith(IMAGE_FILE_PREFIX):
+                    continue
+                try:
+                    if entry.is_file() and entry.stat().st_mtime < expire_before:
+                        os.remove(entry.path)
+                except OSError:
+                    pass
 
-    async def _generic_fetch_image_path(self, api_url: str, fmt: str) -> Tuple[str, bool]:
-        retries = 3
-        timeout = self.timeout
-        use_json = fmt == "text"
-        for attempt in range(retries):
+    async def _cleanup_images_task(self):
+        """每天清理一次过期的图片缓存"""
+        while True:
             try:
-                url = f"{api_url}?format={'json' if use_json else 'image'}"
-                if self.api_key:
-                    url += f"&apikey={self.api_key}"
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(url, timeout=timeout) as resp:
-                        if resp.status != 200:
-                            raise Exception(f"状态码: {resp.status}")
-                        if use_json:
-                            data = await resp.json(content_type=None)
-                            img_url = self._extract_first_image_url(data)
-                            if not img_url:
-                                raise Exception("JSON未找到图片URL")
-                            async with session.get(img_url, timeout=timeout) as ir:
-                                if ir.status != 200:
-                                    raise Exception(f"图片状态码: {ir.status}")
-                                b = await ir.read()
-                        else:
-                            b = await resp.read()
-                        f = tempfile.NamedTemporaryFile(delete=False, suffix=".jpeg")
-                        f.write(b)
-                        f.flush()
-                        f.close()
-                        return f.name, True
+                await asyncio.to_thread(self._prune_images)
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
-                logger.error(f"[通用图片] 请求失败 {attempt + 1}/{retries}: {e}")
-                if attempt == retries - 1:
-                    return f"接口报错: {e}", False
-                await asyncio.sleep(1)
-        return "未知错误", False
-
-    def _extract_first_string(self, obj) -> str | None:
-        if isinstance(obj, str):
-            return obj
-        elif isinstance(obj, dict):
-            for v in obj.values():
-                res = self._extract_first_string(v)
-                if res:
-                    return res
-        elif isinstance(obj, list):
-            for item in obj:
-                res = self._extract_first_string(item)
-                if res:
-                    return res
+                logger.warning(f"[图片缓存] 清理失败: {e}")
+            await asyncio.sleep(86400)
+
+    @staticmethod
+    def _extract_first_string(obj) -> str | None:
+        """按深度优先顺序返回 JSON 中第一个非空字符串"""
+        stack = [obj]
+        while stack:
+            cur = stack.pop()
+            if isinstance(cur, str):
+                if cur:
+                    return cur
+            elif isinstance(cur, dict):
+                stack.extend(reversed(list(cur.values())))
+            elif isinstance(cur, list):
+                stack.extend(reversed(cur))
         return None
 
-    def _extract_first_image_url(self, obj) -> str | None:
-        if isinstance(obj, str) and obj.startswith("http") and any(ext in obj for ext in (".jpg", ".jpeg", ".png")):
-            return obj
-        elif isinstance(obj, dict):
-            for v in obj.values():
-                res = self._extract_first_image_url(v)
-                if res:
-                    return res
-        elif isinstance(obj, list):
-            for item in obj:
-                res = self._extract_first_image_url(item)
-                if res:
-                    return res
+    @staticmethod
+    def _extract_first_image_url(obj) -> str | None:
+        """按深度优先顺序返回 JSON 中第一个图片链接"""
+        stack = [obj]
+        while stack:
+            cur = stack.pop()
+            if isinstance(cur, str):
+                if cur.startswith("http") and cur.split("?", 1)[0].endswith(_IMG_EXTS):
+                    return cur
+            elif isinstance(cur, dict):
+                stack.extend(reversed(list(cur.values())))
+            elif isinstance(cur, list):
+                stack.extend(reversed(cur))
         return None
 
     async def _handle_fetch(self, event: AstrMessageEvent, image_func, text_func, fmt: str):
@@ -394,10 +526,6 @@ class Daily60sNewsPlugin(Star):
                 path, ok = await image_func()
                 if ok:
                     await event.send(MessageChain().file_image(path))
-                    try:
-                        os.remove(path)
-                    except:
-                        pass
                 else:
                     await event.send(event.plain_result(str(path)))
             else:
@@ -410,45 +538,54 @@ class Daily60sNewsPlugin(Star):
             await event.send(event.plain_result(f"获取失败: {e}"))
 
     # ========== 定时任务主循环 ==========
+    async def _sleep_until(self, target: datetime.datetime):
+        """分段睡到墙上时间 target，每段最多 5 分钟，系统对时造成的偏差不超过 5 分钟"""
+        while (delta := (target - datetime.datetime.now()).total_seconds()) > 0:
+            await asyncio.sleep(min(delta, 300))
+
     async def _daily_task(self):
+        failures = 0
         while True:
             try:
                 next_push = self._get_next_push_time()
                 sleep_seconds = (next_push - datetime.datetime.now()).total_seconds()
                 logger.info(f"[定时推送] 下次推送将在 {sleep_seconds / 3600:.2f} 小时后 ({next_push})")
-                await asyncio.sleep(max(sleep_seconds, 0))
+                await self._sleep_until(next_push)
+                self._last_push = next_push
 
-                # 推送所有启用的内容
+                # 各类内容互不依赖，并发推送所有启用的内容
+                jobs = []
                 if self.enable_news:
-                    await self._send_to_groups(
+                    jobs.append(self._send_to_groups(
                         self._fetch_news_image_path if self.format == "image" else self._fetch_news_text,
                         self.format == "image"
-                    )
+                    ))
                 if self.enable_moyu:
-                    await self._send_to_groups(
+                    jobs.append(self._send_to_groups(
                         self._moyu_fetch_image_path if self.moyu_format == "image" else self._moyu_fetch_text,
                         self.moyu_format == "image"
-                    )
+                    ))
                 if self.enable_gold:
-                    await self._send_to_groups(
+                    jobs.append(self._send_to_groups(
                         self._gold_fetch_image_path if self.gold_format == "image" else self._gold_fetch_text,
                         self.gold_format == "image"
-                    )
+                    ))
                 if self.enable_ai:
                     weekday = datetime.datetime.now().weekday()
                     if weekday not in (5, 6):  # 周六日不推（原逻辑是周日周一？这里按常理调整为周末）
-                        await self._send_to_groups(
+                        jobs.append(self._send_to_groups(
                             self._ai_fetch_image_path if self.ai_format == "image" else self._ai_fetch_text,
                             self.ai_format == "image"
-                        )
+                        ))
                     else:
                         logger.info("[AI资讯] 周末不推送")
-
-                await asyncio.sleep(60)  # 避免同一分钟内重复触发
+                await asyncio.gather(*jobs, return_exceptions=True)
+                failures = 0
 
             except asyncio.CancelledError:
                 break
-            except Exception as e:
-                logger.error(f"[nyscheduler] 定时任务出错: {e}")
-                traceback.print_exc()
-                await asyncio.sleep(300)
+            except Exception:
+                logger.exception("[nyscheduler] 定时任务出错")
+                # 连续出错时按 10s、20s、40s... 退避，最长 10 分钟
+                await asyncio.sleep(min(10 * 2 ** failures, 600))
+                failures += 1